@@ -4,18 +4,25 @@ import functools, os, re, time, typing, abc
 import attr, click, typer, typer.core
 
 DO_NOT_TRACK = 'BENTOML_DO_NOT_TRACK'
+CAMEL_CASE_BOUNDARY_RE = re.compile(r'(?<!^)(?=[A-Z])')
+
+
+@functools.lru_cache
+def _event_name_from_class_name(class_name: str) -> str:
+    # camel case to snake case
+    event_name = CAMEL_CASE_BOUNDARY_RE.sub('_', class_name).lower()
+    # remove "_event" suffix
+    suffix_to_remove = '_event'
+    if event_name.endswith(suffix_to_remove):
+        event_name = event_name[: -len(suffix_to_remove)]
+    return event_name
 
 
 class EventMeta(abc.ABC):
     @property
     def event_name(self) -> str:
-        # camel case to snake case
-        event_name = re.sub(r'(?<!^)(?=[A-Z])', '_', self.__class__.__name__).lower()
-        # remove "_event" suffix
-        suffix_to_remove = '_event'
-        if event_name.endswith(suffix_to_remove):
-            event_name = event_name[: -len(suffix_to_remove)]
-        return event_name
+        # the name only depends on the class, so the conversion is done once per event type
+        return _event_name_from_class_name(self.__class__.__name__)
 
 
 @attr.define
@@ -44,7 +51,7 @@ class OpenLLMTyper(typer.Typer):
         if 'help_option_names' not in context_settings:
             context_settings['help_option_names'] = ('-h', '--help')
         if 'max_content_width' not in context_settings:
-            context_settings['max_content_width'] = int(os.environ.get('COLUMNS', str(120)))
+            context_settings['max_content_width'] = int(os.environ.get('COLUMNS', 120))
         klass = kwargs.pop('cls', OrderedCommands)
 
         super().__init__(
@@ -62,25 +69,21 @@ class OpenLLMTyper(typer.Typer):
                 @functools.wraps(f)
                 @click.pass_context
                 def wrapped(ctx: click.Context, *args, **kwargs):
-                    from bentoml._internal.utils.analytics import track
+                    if os.environ.get(DO_NOT_TRACK, '').lower() == 'true':
+                        return f(*args, **kwargs)
 
-                    do_not_track = os.environ.get(DO_NOT_TRACK, str(False)).lower() == 'true'
+                    # importing bentoml is costly, only pay for it when the event is actually sent
+                    from bentoml._internal.utils.analytics import track
 
                     # so we know that the root program is openllm
                     command_name = ctx.info_name
-                    if ctx.parent.parent is not None:
-                        # openllm model list
-                        command_group = ctx.parent.info_name
-                    elif ctx.parent.info_name == ctx.find_root().info_name:
-                        # openllm run
-                        command_group = 'openllm'
-
-                    if do_not_track:
-                        return f(*args, **kwargs)
-                    start_time = time.time_ns()
+                    # a parent without its own parent is the root: `openllm run` vs `openllm model list`
+                    command_group = ctx.parent.info_name if ctx.parent.parent is not None else 'openllm'
+
+                    start_time = time.perf_counter_ns()
                     try:
                         return_value = f(*args, **kwargs)
-                        duration_in_ns = time.time_ns() - start_time
+                        duration_in_ns = time.perf_counter_ns() - start_time
                         track(
                             OpenllmCliEvent(
                                 cmd_group=command_group, cmd_name=command_name, duration_in_ms=duration_in_ns / 1e6
@@ -88,7 +91,7 @@ class OpenLLMTyper(typer.Typer):
                         )
                         return return_value
                     except BaseException as e:
-                        duration_in_ns = time.time_ns() - start_time
+                        duration_in_ns = time.perf_counter_ns() - start_time
                         track(
                             OpenllmCliEvent(
                                 cmd_group=command_group,
@@ -15,16 +15,30 @@ def _du(path: pathlib.Path) -> int:
     seen_paths = set()
     used_space = 0
 
-    for f in path.rglob('*'):
-        if os.name == 'nt':  # Windows system
-            # On Windows, directly add file sizes without considering hard links
-            used_space += f.stat().st_size
-        else:
-            # On non-Windows systems, use inodes to avoid double counting
-            stat = f.stat()
-            if stat.st_ino not in seen_paths:
-                seen_paths.add(stat.st_ino)
-                used_space += stat.st_size
+    # scandir carries the entry type from the directory listing, and lstat does not follow
+    # symlinks, so links are neither resolved nor break the walk when dangling
+    dirs: list[str] = [os.fspath(path)]
+    while dirs:
+        try:
+            entries = os.scandir(dirs.pop())
+        except OSError:
+            continue
+        with entries:
+            for entry in entries:
+                try:
+                    stat = entry.stat(follow_symlinks=False)
+                except OSError:
+                    continue
+                if entry.is_dir(follow_symlinks=False):
+                    dirs.append(entry.path)
+                if os.name == 'nt':  # Windows system
+                    # On Windows, directly add file sizes without considering hard links
+                    used_space += stat.st_size
+                else:
+                    # On non-Windows systems, use inodes to avoid double counting
+                    if stat.st_ino not in seen_paths:
+                        seen_paths.add(stat.st_ino)
+                        used_space += stat.st_size
     return used_space
 
 
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-import json, os, pathlib, shutil, subprocess, typing
+import functools, json, os, pathlib, shutil, subprocess, typing
 import typer
 
 from openllm.analytic import OpenLLMTyper
@@ -28,15 +28,10 @@ def _get_deploy_cmd(bento: BentoInfo, target: typing.Optional[DeploymentTarget]
             f'This model requires the following environment variables to run: {required_env_names!r}', style='yellow'
         )
 
-    for env_info in bento.bento_yaml.get('envs', []):
+    for env_info in required_envs:
         if 'name' not in env_info:
             continue
-        if os.environ.get(env_info['name']):
-            default = os.environ[env_info['name']]
-        elif 'value' in env_info:
-            default = env_info['value']
-        else:
-            default = ''
+        default = os.environ.get(env_info['name']) or env_info.get('value', '')
 
         if INTERACTIVE.get():
             import questionary
@@ -67,6 +62,8 @@ def _get_deploy_cmd(bento: BentoInfo, target: typing.Optional[DeploymentTarget]
     return cmd, env
 
 
+# each check spawns a bentoml process that talks to BentoCloud; a successful login holds for the whole command
+@functools.lru_cache
 def ensure_cloud_context() -> None:
     import questionary
 
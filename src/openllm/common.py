@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-import asyncio, asyncio.subprocess, functools, hashlib, io, json, os, pathlib, signal, subprocess, sys, sysconfig, typing, shlex
+import asyncio, asyncio.subprocess, functools, hashlib, json, os, pathlib, signal, subprocess, sys, sysconfig, typing, shlex
 import typer, typer.core, pydantic, questionary, pyaml, yaml
 
 from collections import UserDict
@@ -25,6 +25,9 @@ VENV_DIR.mkdir(exist_ok=True, parents=True)
 
 CONFIG_FILE = OPENLLM_HOME / 'config.json'
 
+# the libyaml bindings are several times faster, but are not always compiled in
+YAML_LOADER = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
 CHECKED = 'Yes'
 
 T = typing.TypeVar('T')
@@ -61,10 +64,9 @@ def output(content: typing.Any, level: int = 0, style: str | None = None, end: s
         return
 
     if not isinstance(content, str):
-        out = io.StringIO()
-        pyaml.pprint(content, dst=out, sort_dicts=False, sort_keys=False)
-        questionary.print(out.getvalue(), style=style, end='' if end is None else end)
-        out.close()
+        questionary.print(
+            pyaml.dump(content, sort_dicts=False, sort_keys=False), style=style, end='' if end is None else end
+        )
     else:
         questionary.print(content, style=style, end='\n' if end is None else end)
 
@@ -79,19 +81,18 @@ class Config(pydantic.BaseModel):
         return dict(repos=self.repos, default_repo=self.default_repo)
 
 
+@functools.lru_cache(maxsize=1)
 def load_config() -> Config:
-    if CONFIG_FILE.exists():
-        try:
-            with open(CONFIG_FILE) as f:
-                return Config(**json.load(f))
-        except json.JSONDecodeError:
-            return Config()
-    return Config()
+    try:
+        return Config(**json.loads(CONFIG_FILE.read_bytes()))
+    except (FileNotFoundError, json.JSONDecodeError):
+        return Config()
 
 
 def save_config(config: Config) -> None:
     with open(CONFIG_FILE, 'w') as f:
         json.dump(config.tolist(), f, indent=2)
+    load_config.cache_clear()
 
 
 class BentoMetadata(typing.TypedDict):
@@ -101,6 +102,7 @@ class BentoMetadata(typing.TypedDict):
     envs: list[dict[str, str]]
     services: list[dict[str, typing.Any]]
     schema: dict[str, typing.Any]
+    image: dict[str, typing.Any]
 
 
 class EnvVars(UserDict[str, str]):
@@ -161,6 +163,11 @@ class BentoInfo(pydantic.BaseModel):
 
     @override
     def __hash__(self) -> int:
+        return self._path_hash
+
+    @functools.cached_property
+    def _path_hash(self) -> int:
+        # hashed on every can_run cache lookup, compute the digest only once
         return md5(str(self.path))
 
     @property
@@ -191,7 +198,7 @@ class BentoInfo(pydantic.BaseModel):
 
     @functools.cached_property
     def bento_yaml(self) -> BentoMetadata:
-        bento: BentoMetadata = yaml.safe_load((self.path / 'bento.yaml').read_text())
+        bento: BentoMetadata = yaml.load((self.path / 'bento.yaml').read_text(), Loader=YAML_LOADER)
         return bento
 
     @functools.cached_property
@@ -278,6 +285,10 @@ class VenvSpec(pydantic.BaseModel):
 
     @override
     def __hash__(self) -> int:
+        return self._spec_hash
+
+    @functools.cached_property
+    def _spec_hash(self) -> int:
         return md5(self.normalized_requirements_txt, str(hash(self.normalized_envs)))
 
 
@@ -319,14 +330,13 @@ class DeploymentTarget(pydantic.BaseModel):
         return ', '.join((f'{a.model}' for a in self.accelerators))
 
 
-def run_command(
-    cmd: list[str],
-    cwd: str | None = None,
-    env: EnvVars | None = None,
-    copy_env: bool = True,
-    venv: pathlib.Path | None = None,
-    silent: bool = False,
-) -> subprocess.CompletedProcess[typing.Any]:
+def _prepare_command(
+    cmd: list[str], cwd: str | None, env: EnvVars | None, copy_env: bool, venv: pathlib.Path | None, silent: bool
+) -> tuple[list[str], dict[str, str] | None]:
+    """
+    Echo the command unless silent, and resolve `python`/`bentoml` to the interpreter of the given venv.
+    Returns the final argv and the environment for the child process.
+    """
     env = env or EnvVars({})
     cmd = [str(c) for c in cmd]
     bin_dir = 'Scripts' if os.name == 'nt' else 'bin'
@@ -346,21 +356,38 @@ def run_command(
     else:
         py = pathlib.Path(sys.executable)
 
+    # the child environment is only handed to subprocess, a plain dict is enough;
+    # None lets the child inherit os.environ without copying it when there is nothing to override
+    proc_env: dict[str, str] | None
     if copy_env:
-        env = EnvVars({**os.environ, **env})
+        proc_env = os.environ | env if env else None
+    else:
+        proc_env = dict(env)
 
     if cmd and cmd[0] == 'bentoml':
-        cmd = [py.__fspath__(), '-m', 'bentoml'] + cmd[1:]
+        cmd = [os.fspath(py), '-m', 'bentoml'] + cmd[1:]
     if cmd and cmd[0] == 'python':
-        cmd = [py.__fspath__()] + cmd[1:]
+        cmd = [os.fspath(py)] + cmd[1:]
+    return cmd, proc_env
+
+
+def run_command(
+    cmd: list[str],
+    cwd: str | None = None,
+    env: EnvVars | None = None,
+    copy_env: bool = True,
+    venv: pathlib.Path | None = None,
+    silent: bool = False,
+) -> subprocess.CompletedProcess[typing.Any]:
+    cmd, proc_env = _prepare_command(cmd, cwd=cwd, env=env, copy_env=copy_env, venv=venv, silent=silent)
 
     try:
         if silent:
             return subprocess.run(
-                cmd, cwd=cwd, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=True
+                cmd, cwd=cwd, env=proc_env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=True
             )
         else:
-            return subprocess.run(cmd, cwd=cwd, env=env, check=True)
+            return subprocess.run(cmd, cwd=cwd, env=proc_env, check=True)
     except Exception as e:
         if VERBOSE_LEVEL.get() >= 20:
             output(str(e), style='red')
@@ -382,37 +409,13 @@ async def async_run_command(
     venv: pathlib.Path | None = None,
     silent: bool = True,
 ) -> typing.AsyncGenerator[asyncio.subprocess.Process]:
-    env = env or EnvVars({})
-    cmd = [str(c) for c in cmd]
-
-    if not silent:
-        output('\n')
-        if cwd:
-            output(f'$ cd {cwd}', style='orange')
-        if env:
-            for k, v in env.items():
-                output(f'$ export {k}={shlex.quote(v)}', style='orange')
-        if venv:
-            output(f'$ source {venv / "bin" / "activate"}', style='orange')
-        output(f'$ {" ".join(cmd)}', style='orange')
-
-    if venv:
-        py = venv / 'bin' / 'python'
-    else:
-        py = pathlib.Path(sys.executable)
-
-    if copy_env:
-        env = EnvVars({**os.environ, **env})
-
-    if cmd and cmd[0] == 'bentoml':
-        cmd = [py.__fspath__(), '-m', 'bentoml'] + cmd[1:]
-    if cmd and cmd[0] == 'python':
-        cmd = [py.__fspath__()] + cmd[1:]
+    cmd, proc_env = _prepare_command(cmd, cwd=cwd, env=env, copy_env=copy_env, venv=venv, silent=silent)
 
     proc = None
     try:
-        proc = await asyncio.create_subprocess_shell(
-            ' '.join(map(str, cmd)), stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE, cwd=cwd, env=env
+        # exec directly: no intermediate shell to start, and signals reach the server itself
+        proc = await asyncio.create_subprocess_exec(
+            *cmd, stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE, cwd=cwd, env=proc_env
         )
         yield proc
     except subprocess.CalledProcessError:
@@ -420,7 +423,8 @@ async def async_run_command(
         raise typer.Exit(1)
     finally:
         if proc:
-            proc.send_signal(signal.SIGINT)
+            if proc.returncode is None:
+                proc.send_signal(signal.SIGINT)
             await proc.wait()
 
 
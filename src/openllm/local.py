@@ -1,9 +1,7 @@
 from __future__ import annotations
 
 import asyncio, time, typing
-import httpx, openai
 
-from openai.types.chat import ChatCompletionAssistantMessageParam, ChatCompletionUserMessageParam
 from openllm.common import BentoInfo, EnvVars, async_run_command, output, run_command, stream_command_output
 from openllm.venv import ensure_venv
 
@@ -14,13 +12,7 @@ if typing.TYPE_CHECKING:
 def prep_env_vars(bento: BentoInfo) -> None:
     import os
 
-    env_vars = bento.envs
-    for env_var in env_vars:
-        if not env_var.get('value'):
-            continue
-        key = env_var['name']
-        value = env_var['value']
-        os.environ[key] = value
+    os.environ.update({env_var['name']: env_var['value'] for env_var in bento.envs if env_var.get('value')})
 
 
 def _get_serve_cmd(bento: BentoInfo, port: int = 3000) -> tuple[list[str], EnvVars]:
@@ -39,6 +31,10 @@ def serve(bento: BentoInfo, port: int = 3000) -> None:
 
 
 async def _run_model(bento: BentoInfo, port: int = 3000, timeout: int = 600) -> None:
+    # openai and httpx are slow to import and only needed here, keep them off the CLI startup path
+    import httpx, openai
+    from openai.types.chat import ChatCompletionAssistantMessageParam, ChatCompletionUserMessageParam
+
     cmd, env = _get_serve_cmd(bento, port)
     venv = ensure_venv(bento, runtime_envs=env)
     async with async_run_command(cmd, env=env, cwd=None, venv=venv, silent=False) as server_proc:
@@ -46,26 +42,50 @@ async def _run_model(bento: BentoInfo, port: int = 3000, timeout: int = 600) ->
 
         stdout_streamer = None
         stderr_streamer = None
-        start_time = time.time()
+        start_time = time.monotonic()
 
         output('Model loading...', style='green')
-        for _ in range(timeout):
-            try:
-                resp = httpx.get(f'http://localhost:{port}/readyz', timeout=3)
-                if resp.status_code == 200:
+        ready = False
+        # poll without blocking the event loop so the log streamers keep running
+        async with httpx.AsyncClient(base_url=f'http://localhost:{port}', timeout=3) as http_client:
+            while time.monotonic() - start_time < timeout:
+                if server_proc.returncode is not None:
+                    # the server died while loading, waiting for the timeout is pointless
                     break
-            except httpx.RequestError:
-                if time.time() - start_time > 30:
-                    if not stdout_streamer:
-                        stdout_streamer = asyncio.create_task(stream_command_output(server_proc.stdout, style='gray'))
-                    if not stderr_streamer:
-                        stderr_streamer = asyncio.create_task(
-                            stream_command_output(server_proc.stderr, style='#BD2D0F')
-                        )
+                try:
+                    resp = await http_client.get('/readyz')
+                    if resp.status_code == 200:
+                        ready = True
+                        break
+                except httpx.RequestError:
+                    if time.monotonic() - start_time > 30:
+                        if not stdout_streamer:
+                            stdout_streamer = asyncio.create_task(
+                                stream_command_output(server_proc.stdout, style='gray')
+                            )
+                        if not stderr_streamer:
+                            stderr_streamer = asyncio.create_task(
+                                stream_command_output(server_proc.stderr, style='#BD2D0F')
+                            )
+                # not up yet, or up but still loading the model (503)
                 await asyncio.sleep(1)
-        else:
+        if not ready:
+            if server_proc.returncode is not None:
+                # the log streamers only start after 30s, make sure the reason of an early exit is shown
+                try:
+                    await asyncio.wait_for(
+                        asyncio.gather(
+                            stdout_streamer or stream_command_output(server_proc.stdout, style='gray'),
+                            stderr_streamer or stream_command_output(server_proc.stderr, style='#BD2D0F'),
+                        ),
+                        timeout=5,
+                    )
+                except asyncio.TimeoutError:
+                    pass
+                output(f'Model server exited with code {server_proc.returncode}', style='red')
+            else:
+                server_proc.terminate()
             output('Model failed to load', style='red')
-            server_proc.terminate()
             return
 
         if stdout_streamer:
@@ -77,6 +97,8 @@ async def _run_model(bento: BentoInfo, port: int = 3000, timeout: int = 600) ->
         messages: list[ChatCompletionMessageParam] = []
 
         client = openai.AsyncOpenAI(base_url=f'http://localhost:{port}/v1', api_key='local')
+        # the served model does not change for the lifetime of the server, resolve it once up front
+        model_id = (await client.models.list()).data[0].id
         while True:
             try:
                 message = input('user: ')
@@ -85,15 +107,15 @@ async def _run_model(bento: BentoInfo, port: int = 3000, timeout: int = 600) ->
                     continue
                 messages.append(ChatCompletionUserMessageParam(role='user', content=message))
                 output('assistant: ', end='', style='lightgreen')
-                assistant_message = ''
-                stream = await client.chat.completions.create(
-                    model=(await client.models.list()).data[0].id, messages=messages, stream=True
-                )
+                assistant_chunks: list[str] = []
+                stream = await client.chat.completions.create(model=model_id, messages=messages, stream=True)
                 async for chunk in stream:
                     text = chunk.choices[0].delta.content or ''
-                    assistant_message += text
+                    assistant_chunks.append(text)
                     output(text, end='', style='lightgreen')
-                messages.append(ChatCompletionAssistantMessageParam(role='assistant', content=assistant_message))
+                messages.append(
+                    ChatCompletionAssistantMessageParam(role='assistant', content=''.join(assistant_chunks))
+                )
                 output('')
             except KeyboardInterrupt:
                 break
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 import re, typing, json
-import tabulate, questionary, typer
+import questionary, typer
 
 from openllm.accelerator_spec import can_run
 from openllm.common import DeploymentTarget
@@ -31,8 +31,13 @@ def list_model(
     if verbose:
         VERBOSE_LEVEL.set(20)
 
-    bentos = list_bento(tag=tag, repo_name=repo)
-    bentos.sort(key=lambda x: x.name)
+    _print_bentos(list_bento(tag=tag, repo_name=repo), output=output)
+
+
+def _print_bentos(bentos: typing.List[BentoInfo], output: typing.Optional[str] = None) -> None:
+    from tabulate import tabulate
+
+    bentos = sorted(bentos, key=lambda x: x.name)
 
     seen = set()
 
@@ -58,7 +63,7 @@ def list_model(
         )
         return
 
-    table = tabulate.tabulate(
+    table = tabulate(
         [
             [
                 '' if is_seen(bento.name) else bento.name,
@@ -94,7 +99,7 @@ def ensure_bento(
 
     # multiple models, pick one according to target
     output_(f'Multiple models match {model}, did you mean one of these?', style='red')
-    list_model(model, repo=repo_name)
+    _print_bentos(bentos)
     raise typer.Exit(1)
 
 
@@ -135,7 +140,6 @@ def list_bento(
         glob_pattern = f'bentoml/bentos/{tag}/*'
 
     model_list: list[BentoInfo] = []
-    repo_list = list_repo(repo_name)
     for repo in repo_list:
         paths = sorted(
             repo.path.glob(glob_pattern),
@@ -156,13 +160,12 @@ def list_bento(
 
     if not include_alias:
         seen: set[str] = set()
+        # aliases resolve to the path of their origin bento, so the path-derived tag identifies
+        # duplicates without parsing every bento.yaml.
         # we are calling side-effect in seen here.
         model_list = [
             x
             for x in model_list
-            if not (
-                f'{x.bento_yaml["name"]}:{x.bento_yaml["version"]}' in seen
-                or seen.add(f'{x.bento_yaml["name"]}:{x.bento_yaml["version"]}')  # type: ignore
-            )
+            if not (x.bentoml_tag in seen or seen.add(x.bentoml_tag))  # type: ignore
         ]
     return model_list
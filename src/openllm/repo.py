@@ -1,12 +1,13 @@
 from __future__ import annotations
 
-import datetime, subprocess, re, shutil, typing, os, pathlib
+import concurrent.futures, datetime, functools, subprocess, re, shutil, typing, os, pathlib
 import pyaml, questionary, typer
 
 from openllm.analytic import OpenLLMTyper
 from openllm.common import INTERACTIVE, REPO_DIR, VERBOSE_LEVEL, RepoInfo, load_config, output, save_config
 
 UPDATE_INTERVAL = datetime.timedelta(days=3)
+MAX_CLONE_WORKERS = 4
 TEST_REPO = os.getenv('OPENLLM_TEST_REPO', None)  # for testing
 
 
@@ -38,20 +39,13 @@ def cmd_remove(name: str) -> None:
 def cmd_update() -> None:
     if TEST_REPO:
         return
-    repos_in_use = set()
-    for repo in list_repo():
-        repos_in_use.add((repo.server, repo.owner, repo.repo, repo.branch))
-        if repo.path.exists():
-            shutil.rmtree(repo.path, ignore_errors=True)
-        repo.path.parent.mkdir(parents=True, exist_ok=True)
-        try:
-            _clone_repo(repo)
-            output('')
-            output(f'Repo `{repo.name}` updated', style='green')
-        except Exception as e:
-            shutil.rmtree(repo.path, ignore_errors=True)
-            output(f'Failed to clone repo {repo.name}', style='red')
-            output(e)
+    repos = list_repo()
+    repos_in_use = {(repo.server, repo.owner, repo.repo, repo.branch) for repo in repos}
+    # repos are cloned into independent directories, so fetch them concurrently.
+    # aliases of the same url share a path and must only be cloned once.
+    unique_repos = {repo.path: repo for repo in repos}.values()
+    with concurrent.futures.ThreadPoolExecutor(max_workers=MAX_CLONE_WORKERS) as executor:
+        list(executor.map(_update_repo, unique_repos))
     for c in REPO_DIR.glob('*/*/*/*'):
         repo_spec = tuple(c.parts[-4:])
         if repo_spec not in repos_in_use:
@@ -131,21 +125,47 @@ def _complete_alias(repo_name: str) -> None:
                     f.write(bento.version)
 
 
+def _update_repo(repo: RepoInfo) -> None:
+    if repo.path.exists():
+        shutil.rmtree(repo.path, ignore_errors=True)
+    repo.path.parent.mkdir(parents=True, exist_ok=True)
+    try:
+        _clone_repo(repo)
+        output('')
+        output(f'Repo `{repo.name}` updated', style='green')
+    except Exception as e:
+        shutil.rmtree(repo.path, ignore_errors=True)
+        output(f'Failed to clone repo {repo.name}', style='red')
+        output(e)
+
+
 def _clone_repo(repo: RepoInfo) -> None:
     try:
-        subprocess.run(['git', 'clone', '--depth=1', '-b', repo.branch, repo.url, str(repo.path)], check=True)
+        # clones run concurrently, progress output from several of them would interleave on the terminal
+        subprocess.run(
+            ['git', 'clone', '--quiet', '--depth=1', '-b', repo.branch, repo.url, str(repo.path)], check=True
+        )
     except (subprocess.CalledProcessError, FileNotFoundError):
         import dulwich
         import dulwich.porcelain
 
-        dulwich.porcelain.clone(repo.url, str(repo.path), checkout=True, depth=1, branch=repo.branch)
+        dulwich.porcelain.clone(
+            repo.url,
+            str(repo.path),
+            checkout=True,
+            depth=1,
+            branch=repo.branch,
+            errstream=dulwich.porcelain.NoneStream(),
+        )
 
 
 def ensure_repo_updated() -> None:
     if TEST_REPO:
         return
     last_update_file = REPO_DIR / 'last_update'
-    if not last_update_file.exists():
+    try:
+        last_update_text = last_update_file.read_text()
+    except FileNotFoundError:
         if INTERACTIVE.get():
             choice = questionary.confirm(
                 'The repo cache is never updated, do you want to update it to fetch the latest model list?'
@@ -159,7 +179,7 @@ def ensure_repo_updated() -> None:
                 style='red',
             )
             raise typer.Exit(1)
-    last_update = datetime.datetime.fromisoformat(last_update_file.read_text().strip())
+    last_update = datetime.datetime.fromisoformat(last_update_text.strip())
     if datetime.datetime.now() - last_update > UPDATE_INTERVAL:
         if INTERACTIVE.get():
             choice = questionary.confirm(
@@ -182,6 +202,7 @@ GIT_SSH_RE = re.compile(
 )
 
 
+@functools.lru_cache
 def parse_repo_url(repo_url: str, repo_name: typing.Optional[str] = None) -> RepoInfo:
     """
     parse the git repo url to server, owner, repo name, branch
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 import functools, os, pathlib, shutil
-import typer, yaml
+import typer
 
 from openllm.common import VENV_DIR, VERBOSE_LEVEL, BentoInfo, EnvVars, VenvSpec, output, run_command
 
@@ -13,11 +13,10 @@ def _resolve_bento_venv_spec(bento: BentoInfo, runtime_envs: EnvVars | None = No
         lock_file = bento.path / 'env' / 'python' / 'requirements.txt'
 
     reqs = lock_file.read_text().strip()
-    bentofile = bento.path / 'bento.yaml'
-    data = yaml.safe_load(bentofile.read_text())
+    data = bento.bento_yaml
     bento_env_list = data.get('envs', [])
     python_version = data.get('image', {})['python_version']
-    bento_envs = {e['name']: e.get('value') for e in bento_env_list}
+    bento_envs = {e['name']: e.get('value', '') for e in bento_env_list}
     envs = {k: runtime_envs.get(k, v) for k, v in bento_envs.items()} if runtime_envs else {}
 
     return VenvSpec(
@@ -36,18 +35,14 @@ def _ensure_venv(venv_spec: VenvSpec) -> pathlib.Path:
         output(f'Installing model dependencies({venv})...', style='green')
 
         venv_py = venv / 'Scripts' / 'python.exe' if os.name == 'nt' else venv / 'bin' / 'python'
+        verbose = VERBOSE_LEVEL.get() >= 10
         try:
             run_command(
-                ['python', '-m', 'uv', 'venv', venv.__fspath__(), '-p', venv_spec.python_version],
-                silent=VERBOSE_LEVEL.get() < 10,
-            )
-            run_command(
-                ['python', '-m', 'uv', 'pip', 'install', '-p', str(venv_py), 'bentoml'],
-                silent=VERBOSE_LEVEL.get() < 10,
-                env=venv_spec.envs,
+                ['python', '-m', 'uv', 'venv', os.fspath(venv), '-p', venv_spec.python_version], silent=not verbose
             )
             with open(venv / 'requirements.txt', 'w') as f:
                 f.write(venv_spec.normalized_requirements_txt)
+            # a single resolve for bentoml and the bento's requirements instead of one uv run each
             run_command(
                 [
                     'python',
@@ -57,17 +52,18 @@ def _ensure_venv(venv_spec: VenvSpec) -> pathlib.Path:
                     'install',
                     '-p',
                     str(venv_py),
+                    'bentoml',
                     '-r',
-                    (venv / 'requirements.txt').__fspath__(),
+                    os.fspath(venv / 'requirements.txt'),
                 ],
-                silent=VERBOSE_LEVEL.get() < 10,
+                silent=not verbose,
                 env=venv_spec.envs,
             )
             with open(venv / 'DONE', 'w') as f:
                 f.write('DONE')
         except Exception as e:
             shutil.rmtree(venv, ignore_errors=True)
-            if VERBOSE_LEVEL.get() >= 10:
+            if verbose:
                 output(str(e), style='red')
             output(f'Failed to install dependencies to {venv}. Cleaned up.', style='red')
             raise typer.Exit(1)